@@ -0,0 +1,90 @@
+#! /usr/bin/env python3
+#  -*- coding: utf-8 -*-
+"""Benchmark de transportes HTTP
+
+    Levanta un servidor local que imita la respuesta del CNE en un proceso aparte y mide, para cada
+    transporte, las consultas por segundo y las consultas por segundo de CPU del cliente (por núcleo).
+
+    Uso:
+        $ python benchmarks/bench_transport.py -n 2000
+"""
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from pyElectoral import CNE, RequestsTransport, HTTPTransport
+
+BODY = (
+    "<html><body>Cédula: V-12000000 Nombre: JUAN PEREZ Estado: EDO. MIRANDA Municipio: MP. SUCRE "
+    "Parroquia: PQ. PETARE Centro: ESCUELA BOLIVARIANA Dirección: CALLE 1 Registro Electoral</body></html>"
+).encode("utf-8")
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    wbufsize = -1
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+        self.wfile.flush()
+
+    def log_message(self, *args):
+        pass
+
+
+def serve(port) -> None:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    port.value = server.server_port
+    server.serve_forever()
+
+
+def bench(name: str, transport, url: str, n: int) -> None:
+    cne = CNE(url, transport=transport)
+    get = cne.transport.get
+    payload = {"nacionalidad": "V", "cedula": 12000000}
+    get(url, payload)
+
+    wall, cpu = time.perf_counter(), time.process_time()
+    for i in range(n):
+        payload["cedula"] = 12000000 + i
+        get(url, payload)
+    wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+    print(f"{name:<12} transporte: {n / wall:>9.0f} req/s  {n / cpu:>9.0f} req/s por núcleo")
+
+    wall, cpu = time.perf_counter(), time.process_time()
+    for i in range(n):
+        cne.query("V", 12000000 + i)
+    wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+    print(f"{name:<12} query:      {n / wall:>9.0f} req/s  {n / cpu:>9.0f} req/s por núcleo")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark de transportes de pyElectoral")
+    parser.add_argument("-n", type=int, default=2000, help="Consultas por transporte")
+    args = parser.parse_args()
+
+    port = multiprocessing.Value("i", 0)
+    server = multiprocessing.Process(target=serve, args=(port,), daemon=True)
+    server.start()
+    while not port.value:
+        time.sleep(0.01)
+    url = f"http://127.0.0.1:{port.value}/web/registro_electoral/ce.php"
+
+    try:
+        bench("requests", RequestsTransport(), url, args.n)
+        bench("http.client", HTTPTransport(), url, args.n)
+    finally:
+        server.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,83 @@
 #! /usr/bin/env python3
 #  -*- coding: utf-8 -*-
 """MODULO CNE"""
-import requests
 import re
+import time
+import threading
+from collections import deque
+from concurrent.futures import Future, wait, FIRST_COMPLETED
 from bs4 import BeautifulSoup
-from dataclasses import asdict
+from dataclasses import asdict, dataclass, field
 from .Data import ResponseData, STATUS
+from .Stats import Aggregator
+from .Transport import RequestsTransport
+
+
+@dataclass
+class HedgePolicy:
+    """Política de peticiones duplicadas (hedging) para recortar la latencia de cola del CNE
+
+    Si la consulta no responde antes del percentil `percentile` de las latencias observadas,
+    se lanza una segunda petición (opcionalmente a `alternate_url`) y se toma la primera en responder.
+
+    Args:
+        percentile (float, optional): Percentil de latencia tras el cual se duplica la petición. Defaults to 95.0.
+        delay (float, optional): Retraso en segundos usado mientras no haya suficientes muestras. Defaults to 1.0.
+        alternate_url (str, optional): URL alterna para la petición duplicada. Defaults to None (misma URL).
+        max_rate (float, optional): Fracción máxima de consultas que pueden duplicarse. Defaults to 0.1.
+        burst (int, optional): Duplicados permitidos por encima de `max_rate`, permite duplicar desde la primera consulta. Defaults to 1.
+        window (int, optional): Cantidad de latencias recientes a conservar. Defaults to 200.
+        min_samples (int, optional): Muestras necesarias antes de usar el percentil. Defaults to 20.
+        timeout (float, optional): Tiempo máximo en segundos de cada petición cuando la consulta no tiene deadline. Defaults to 30.0.
+    """
+    percentile: float = 95.0
+    delay: float = 1.0
+    alternate_url: str = None
+    max_rate: float = 0.1
+    burst: int = 1
+    window: int = 200
+    min_samples: int = 20
+    timeout: float = 30.0
+    queries: int = field(default=0, init=False)
+    hedged: int = field(default=0, init=False)
+
+    def __post_init__(self):
+        if not 0 < self.percentile <= 100:
+            raise ValueError("[PYELECTORAL] El percentil debe estar entre 0 y 100")
+        self._samples: deque = deque(maxlen=self.window)
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self) -> float:
+        """Fracción de consultas que han sido duplicadas"""
+        return self.hedged / self.queries if self.queries else 0.0
+
+    def hedge_delay(self) -> float:
+        """Retraso en segundos antes de lanzar la petición duplicada"""
+        with self._lock:
+            if len(self._samples) < self.min_samples:
+                return self.delay
+            samples = sorted(self._samples)
+        ix = min(len(samples) - 1, int(len(samples) * self.percentile / 100))
+        return samples[ix]
+
+    def start(self) -> None:
+        """Registra el inicio de una consulta"""
+        with self._lock:
+            self.queries += 1
+
+    def record(self, latency: float) -> None:
+        """Registra la latencia de una consulta completada"""
+        with self._lock:
+            self._samples.append(latency)
+
+    def allow(self) -> bool:
+        """Indica si se puede duplicar otra consulta sin exceder `max_rate * queries + burst` duplicados"""
+        with self._lock:
+            if self.hedged + 1 > self.max_rate * self.queries + self.burst:
+                return False
+            self.hedged += 1
+            return True
 
 
 class CNE:  
@@ -13,6 +85,8 @@ class CNE:
 
     Args:
         other_url (str, optional): URL del CNE para consultar, (Utils cuando hay elecciones). Defaults to None.
+        hedge (HedgePolicy, optional): Política de peticiones duplicadas. Defaults to None.
+        transport (optional): Transporte HTTP a usar, ver `pyElectoral.Transport`. Defaults to None (`RequestsTransport`).
     """ 
     
     URL = "http://www.cne.gob.ve/web/registro_electoral/ce.php" # URL BASE DEL CNE
@@ -30,14 +104,33 @@ class CNE:
         "NOT_EXISTS": "Esta cédula de identidad no se encuentra inscrita en el Registro Electoral"
     }
     
-    def __init__(self, other_url: str = None):
+    def __init__(self, other_url: str = None, hedge: HedgePolicy = None, transport = None):
         """Inicializa las consultas de cédulas del CNE Venezuela
 
         Args:
             other_url (str, optional): URL del CNE para consultar, (Utils cuando hay elecciones). Defaults to None.
+            hedge (HedgePolicy, optional): Política de peticiones duplicadas. Defaults to None.
+            transport (optional): Transporte HTTP a usar, ver `pyElectoral.Transport`. Defaults to None (`RequestsTransport`).
         """
         if other_url:
             self.URL = other_url
+        self.hedge = hedge
+        self.transport = transport or RequestsTransport()
+        self._inflight: set = set()
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Abandona las peticiones que sigan en curso (duplicadas o fuera de tiempo)"""
+        with self._lock:
+            for cancel in self._inflight:
+                cancel.set()
+            self._inflight.clear()
     
     def set_dict(self, data) -> None:
         self._dictionary.update(data)
@@ -52,12 +145,17 @@ class CNE:
     def as_dict(self) -> dict:
         return asdict(self._result)
     
-    def query(self, nat: str, dni: str|int) -> ResponseData:
+    def query(self, nat: str, dni: str|int, deadline: float = None) -> ResponseData:
         """Consulta del CNE
 
         Args:
             nat (str): Nacionalidad por defecto es "V"
             dni (str | int): Cédula de Identidad a consultar
+            deadline (float, optional): Tiempo máximo en segundos para obtener respuesta. Defaults to None (sin límite).
+
+        Raises:
+            ConnectionError: Si no se puede establecer conexión con el servidor
+            TimeoutError: Si el servidor no responde antes de `deadline`
 
         Returns:
             ResponseData: Retoran una clase `ResponseData` con los datos optenidos
@@ -67,10 +165,12 @@ class CNE:
         self.payload['cedula'] = dni
         self._result = ResponseData(f"{nat}-{str(dni)}", STATUS.NO_RESPONSE)
         
-        try:
-            r = requests.get(self.URL, params=self.payload)
-        except:
-           raise ConnectionError(self.err(0))
+        if self.hedge:
+            r = self._hedged_get(dict(self.payload), deadline)
+        elif deadline is not None:
+            r = self._deadline_get(dict(self.payload), deadline)
+        else:
+            r = self._get(self.URL, self.payload)
        
         if r.status_code == 200:
             content = self._parse_html(r.content)
@@ -82,6 +182,82 @@ class CNE:
             
         return self._result
         
+    def _get(self, url: str, payload: dict, timeout: float = None, cancel: threading.Event = None):
+        try:
+            return self.transport.get(url, payload, timeout, cancel)
+        except TimeoutError:
+            raise TimeoutError(self.err(3))
+        except:
+            raise ConnectionError(self.err(0))
+
+    def _submit(self, url: str, payload: dict, timeout: float|None) -> tuple:
+        # cada petición corre en su propio hilo daemon, una petición abandonada no bloquea a las siguientes
+        future: Future = Future()
+        cancel = threading.Event()
+
+        def run():
+            try:
+                future.set_result(self._get(url, payload, timeout, cancel))
+            except BaseException as e:
+                future.set_exception(e)
+            finally:
+                with self._lock:
+                    self._inflight.discard(cancel)
+
+        with self._lock:
+            self._inflight.add(cancel)
+        threading.Thread(target=run, daemon=True).start()
+        return future, cancel
+
+    def _deadline_get(self, payload: dict, deadline: float):
+        future, cancel = self._submit(self.URL, payload, deadline)
+        done, _ = wait([future], timeout=deadline)
+        if not done:
+            cancel.set()
+            raise TimeoutError(self.err(3))
+        return future.result()
+
+    def _hedged_get(self, payload: dict, deadline: float = None):
+        start = time.monotonic()
+        end = start + deadline if deadline is not None else None
+        self.hedge.start()
+
+        future, cancel = self._submit(self.URL, payload, self._remaining(self.hedge.timeout, end))
+        calls: dict = {future: cancel}
+        done, _ = wait(calls, timeout=self._remaining(self.hedge.hedge_delay(), end))
+        if not done and self._remaining(None, end) != 0 and self.hedge.allow():
+            url = self.hedge.alternate_url or self.URL
+            future, cancel = self._submit(url, payload, self._remaining(self.hedge.timeout, end))
+            calls[future] = cancel
+
+        try:
+            pending = set(calls)
+            error = None
+            while pending:
+                done, pending = wait(pending, timeout=self._remaining(None, end), return_when=FIRST_COMPLETED)
+                if not done:
+                    break
+                for f in done:
+                    if f.exception() is None:
+                        self.hedge.record(time.monotonic() - start)
+                        return f.result()
+                    error = f.exception()
+
+            if error is not None and not pending:
+                raise error
+            raise TimeoutError(self.err(3))
+        finally:
+            # la petición perdedora abandona la lectura en cuanto recibe el aviso
+            for cancel in calls.values():
+                cancel.set()
+
+    @staticmethod
+    def _remaining(timeout: float|None, end: float|None) -> float|None:
+        if end is None:
+            return timeout
+        left = max(0.0, end - time.monotonic())
+        return left if timeout is None else min(timeout, left)
+
     def _valid_content(self, content: str) -> int|bool:
         if self._dictionary['NOT_REGISTER'] in content:
             return STATUS.NOT_REGISTERED
@@ -138,7 +314,8 @@ class CNE:
         return {
             0: f"[PYELECTORAL] No se puede establecer conexión con el servidor CNE.org [{self.payload['nacionalidad']}-{self.payload['cedula']}]",
             1: "[PYELECTORAL] Datos Invalidos",
-            2: "[PYELECTORAL] Los parametros de la consulta no pueden estar vacios"
+            2: "[PYELECTORAL] Los parametros de la consulta no pueden estar vacios",
+            3: f"[PYELECTORAL] El servidor CNE.org no respondió a tiempo [{self.payload['nacionalidad']}-{self.payload['cedula']}]"
         }.get(err_code, "")
         
 class as_collection:
@@ -147,19 +324,37 @@ class as_collection:
         data (list): Lista de cedulas en formato ['V-00000000']
         outher_uri: (str) URL Opcional. Defaults None
         with_tqdm (bool) Indica se se añade una barra de progreso en terminal. Tenga en cuenta que debe tener instalado tqdm. Defaults to False
+        deadline (float, optional): Tiempo máximo en segundos para completar todo el lote. Defaults to None
+        hedge (HedgePolicy, optional): Política de peticiones duplicadas. Defaults to None
+        aggregator (Aggregator, optional): Acumulador de estadísticas que recibe cada resultado. Defaults to None
+        keep_results (bool): Indica si se almacenan los resultados en `results`. Defaults to True
+        transport (optional): Transporte HTTP a usar, ver `pyElectoral.Transport`. Defaults to None
     """
-    def __init__(self, data: list, outher_uri : str = None, with_tqdm : bool = False):
+    def __init__(self, data: list, outher_uri : str = None, with_tqdm : bool = False, deadline: float = None, hedge: HedgePolicy = None, aggregator: Aggregator = None, keep_results: bool = True, transport = None):
         """Inicializa la consulta de cedulas de la lista
 
+        Las cédulas que no se consulten antes de `deadline` se agregan a `errors`.
+
         Args:
             data (list): lista de cédulas
             outher_uri (str, optional): URL opcional. Defaults to None.
             with_tqdm (bool) Indica se se añade una barra de progreso en terminal, Defaults to False
+            deadline (float, optional): Tiempo máximo en segundos para completar todo el lote. Defaults to None.
+            hedge (HedgePolicy, optional): Política de peticiones duplicadas. Defaults to None.
+            aggregator (Aggregator, optional): Acumulador de estadísticas que recibe cada resultado. Defaults to None.
+            keep_results (bool) Indica si se almacenan los resultados, use False junto a `aggregator` para lotes grandes. Defaults to True
+            transport (optional): Transporte HTTP a usar, ver `pyElectoral.Transport`. Defaults to None.
         """
         self.errors: list = []
         self.results: list = []
-        self._cne = CNE(other_url=outher_uri)
-        self._process(data, with_tqdm)
+        self._cne = CNE(other_url=outher_uri, hedge=hedge, transport=transport)
+        self._aggregator = aggregator
+        self._keep_results = keep_results
+        self._end = time.monotonic() + deadline if deadline is not None else None
+        try:
+            self._process(data, with_tqdm)
+        finally:
+            self._cne.close()
             
     def _process(self, data: list, with_tqdm=False) -> None:
         if data == []:
@@ -169,26 +364,35 @@ class as_collection:
             try:
                 from tqdm import tqdm
                 for i in tqdm(data, desc="PyElector Progress: ", ascii=True, colour="#E53935"):
-                    try:
-                        nal, dni = i.split("-")
-                        resultconsult = self._cne.query(nal, int(dni))
-                        self.results.append(resultconsult)
-                    except ConnectionError:
-                        raise
-                    except:
-                        self.errors.append(i)                
+                    self._query(i)
             except ImportError:
                 raise
         else:
             for i in data:
-                try:
-                    nal, dni = i.split("-")
-                    resultconsult = self._cne.query(nal, int(dni))
-                    self.results.append(resultconsult)
-                except ConnectionError:
-                    raise
-                except:
-                    self.errors.append(i)
+                self._query(i)
+
+    def _query(self, i: str) -> None:
+        remaining = CNE._remaining(None, self._end)
+        if remaining == 0:
+            self._error(i)
+            return
+        try:
+            nal, dni = i.split("-")
+            resultconsult = self._cne.query(nal, int(dni), deadline=remaining)
+        except ConnectionError:
+            raise
+        except:
+            self._error(i)
+            return
+        if self._keep_results:
+            self.results.append(resultconsult)
+        if self._aggregator is not None:
+            self._aggregator.add(resultconsult)
+
+    def _error(self, i: str) -> None:
+        self.errors.append(i)
+        if self._aggregator is not None:
+            self._aggregator.add_error()
                 
     def all(self) -> list:
         """Retorna todos los resultados de la busquedad
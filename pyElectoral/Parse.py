@@ -147,6 +147,33 @@ class File_CSV:
                     data.append(UTILS.format_dni_to_str(col[k]))
         return data
 
+    @staticmethod
+    def iter_results(filename: str):
+        """Lee fila por fila un CSV generado por `File_CSV.write` sin cargarlo completo en memoria
+
+        Útil para alimentar un `pyElectoral.Aggregator`:
+        >>> Aggregator().update(File_CSV.iter_results("resultados.csv"))
+
+        Args:
+            filename (str): Nombre del CSV
+
+        Raises:
+            FileNotFoundError: Si el Archivo no existe
+
+        Yields:
+            ResponseData: Resultado de cada fila
+        """
+        if not os.path.exists(filename):
+            raise FileNotFoundError(f"Archivo {filename} no encontrado")
+
+        with open(filename, mode="r", encoding="UTF-8", newline="") as file:
+            reader = csv.reader(file)
+            next(reader, None)
+            for row in reader:
+                row = [v if v != "" else None for v in row]
+                row[1] = int(row[1])
+                yield ResponseData(*row)
+
 # XLSL
 
 class Excel:
@@ -294,29 +321,179 @@ class Jfile:
 
 
 # Generado Python
+
+import mmap
+import struct
+import sys
+import uuid
+from array import array
+from collections.abc import Sequence
+from dataclasses import fields
+
+class LazyData(Sequence):
+    """Secuencia de solo lectura de `ResponseData` respaldada por un archivo de datos generado por `PyFile.write`
+
+    Los registros se leen del archivo bajo demanda, por lo que `len`, el acceso por indice y la
+    iteración no cargan todo el archivo en memoria. El archivo queda abierto hasta llamar a `close()`
+    o salir del bloque `with`.
+
+    Cada registro inicia con una máscara de bits que indica qué campos no son `None`, seguida de los
+    campos separados por `SEP`.
+
+    Args:
+        filename (str): Ruta del archivo de datos
+
+    Raises:
+        FileNotFoundError: Si el archivo no existe
+        ValueError: Si el archivo no es un archivo de datos de PyElectoral
+    """
+    MAGIC: bytes = b"PYEL2\n"
+    SEP: str = "\x1f"
+    _TRAILER = struct.Struct("<QQ")
+    _FIELDS: tuple = tuple(f.name for f in fields(ResponseData))
+    _MASK: int = (len(_FIELDS) + 7) // 8
+    _BATCH: int = 4096
+
+    def __init__(self, filename: str):
+        if not os.path.exists(filename):
+            raise FileNotFoundError(f"El archivo {filename} no existe")
+
+        with open(filename, mode="rb") as file:
+            self._mm = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        size = len(self._mm)
+        if size < len(self.MAGIC) + self._TRAILER.size or self._mm[:len(self.MAGIC)] != self.MAGIC:
+            raise ValueError(f"El archivo {filename} no es un archivo de datos de PyElectoral")
+        self._len, self._index = self._TRAILER.unpack_from(self._mm, size - self._TRAILER.size)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Cierra el archivo de datos, luego no se pueden leer más registros"""
+        self._mm.close()
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __getitem__(self, ix: int|slice) -> ResponseData|list:
+        if isinstance(ix, slice):
+            return [self[i] for i in range(*ix.indices(self._len))]
+        if ix < 0:
+            ix += self._len
+        if not 0 <= ix < self._len:
+            raise IndexError("Indice fuera de rango")
+        start, end = struct.unpack_from("<QQ", self._mm, self._index + ix * 8)
+        return self._decode(self._mm[start:end])
+
+    def __iter__(self):
+        # los offsets se leen por lotes para no mantener una vista del mmap que impida cerrarlo
+        for first in range(0, self._len, self._BATCH):
+            n = min(self._BATCH, self._len - first)
+            offsets = struct.unpack_from(f"<{n + 1}Q", self._mm, self._index + first * 8)
+            for start, end in zip(offsets, offsets[1:]):
+                yield self._decode(self._mm[start:end])
+
+    def __repr__(self) -> str:
+        return f"<LazyData {self._len} registros>"
+
+    @classmethod
+    def _decode(cls, raw: bytes) -> ResponseData:
+        mask = int.from_bytes(raw[:cls._MASK], "little")
+        values = [v if mask >> ix & 1 else None for ix, v in enumerate(raw[cls._MASK:].decode("utf-8").split(cls.SEP))]
+        values[1] = int(values[1])
+        return ResponseData(*values)
+
+    @classmethod
+    def _encode(cls, row: ResponseData) -> bytes:
+        values: list = []
+        mask: int = 0
+        for ix, f in enumerate(cls._FIELDS):
+            v = getattr(row, f)
+            if v is None:
+                v = ""
+            else:
+                v = str(v)
+                mask |= 1 << ix
+            if cls.SEP in v:
+                raise ValueError(f"[PYELECTORAL] Dato no valido para PyFile: {row.cedula}")
+            values.append(v)
+        return mask.to_bytes(cls._MASK, "little") + cls.SEP.join(values).encode("utf-8")
+
+
 class PyFile:
     """Generador de Archivos Python"""
+    EXT: str = ".pyedata"
+
     @staticmethod
     def write(data: list, filename: str, dirname: str) -> None:
         """Genera un Archivo python valido para su posterior uso
 
+        Los datos se guardan en un archivo compacto `<filename>.pyedata` junto al modulo, y el modulo
+        expone `DATA` como una secuencia `LazyData` que crea cada `ResponseData` al consultarlo,
+        por lo que importar el modulo es inmediato sin importar la cantidad de registros.
+
+        El archivo de datos se escribe en un archivo temporal y reemplaza al anterior solo si se completó,
+        el modulo se genera después. Si hay un `DATA` cargado del mismo archivo llame antes a su `close()`.
+
         Args:
-            data (list): Lista de datos ResponseData obtenidos del CNE
+            data (list): Lista de datos ResponseData obtenidos del CNE, puede ser cualquier iterable
             filename (str): Nombre del Archivo .py sin extensión
             dirname (str): Directorio donde generar el modulo Python
 
         Raises:
             FileExistsError: Si el directorio No existe
+            ValueError: Si algún dato contiene el separador `LazyData.SEP`
         """
         if not os.path.exists(dirname):
             raise FileExistsError(f"La dirección {dirname} no existe")
         
+        datafile: str = filename + PyFile.EXT
+        offsets: array = array("Q")
+        # nombre único creado con "xb" para que el archivo tenga los permisos del umask, igual que el modulo
+        tmp: str = os.path.join(dirname, f".{datafile}.{uuid.uuid4().hex}.tmp")
+        try:
+            with open(tmp, mode="xb") as file:
+                file.write(LazyData.MAGIC)
+                pos: int = len(LazyData.MAGIC)
+                for i in data:
+                    raw: bytes = LazyData._encode(i)
+                    offsets.append(pos)
+                    file.write(raw)
+                    pos += len(raw)
+                offsets.append(pos)
+                if sys.byteorder == "big":
+                    offsets.byteswap()
+                file.write(offsets.tobytes())
+                file.write(LazyData._TRAILER.pack(len(offsets) - 1, pos))
+            os.replace(tmp, os.path.join(dirname, datafile))
+        except:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+
         filepath: str = os.path.join(dirname, filename + ".py")
         with open(filepath, mode="w", encoding="utf-8") as file:
             file.write(f"#! /usr/bin/env python3\n#  -*- coding: utf-8 -*-\n")
             file.write(f"# GENERADO POR PyElector\n\n")
-            file.write(f"from pyElectoral import ResponseData\n\n")
-            file.write(f"DATA: list = [\n")
-            for i in data:
-                file.write(f"   {str(i)}, \n")
-            file.write(f"]\n")
\ No newline at end of file
+            file.write(f"import os\n")
+            file.write(f"from pyElectoral.Parse import PyFile\n\n")
+            file.write(f"DATA = PyFile.load(os.path.join(os.path.dirname(os.path.abspath(__file__)), {datafile!r}))\n")
+
+    @staticmethod
+    def load(filename: str) -> LazyData:
+        """Carga el archivo de datos generado por `PyFile.write`
+
+        Args:
+            filename (str): Ruta del archivo `.pyedata`
+
+        Raises:
+            FileNotFoundError: Si el archivo no existe
+
+        Returns:
+            LazyData: Secuencia de `ResponseData` leida bajo demanda
+        """
+        return LazyData(filename)
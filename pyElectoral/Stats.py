@@ -0,0 +1,225 @@
+#! /usr/bin/env python3
+#  -*- coding: utf-8 -*-
+"""MODULO STATS"""
+from .Data import ResponseData, STATUS
+
+LEVELS: tuple = ("estado", "municipio", "parroquia", "centro")
+_STATUSES: list = list(STATUS)
+_COLUMNS: dict = {s.value: ix for ix, s in enumerate(_STATUSES)}
+
+
+class Aggregator:
+    """Acumula conteos por estatus y ubicación a medida que llegan los resultados
+
+    Solo conserva un contador por grupo (estado, municipio, parroquia y centro), por lo que la
+    memoria depende de la cantidad de grupos y no de la cantidad de cédulas procesadas.
+
+    Los agregados se pueden serializar con `pickle`, por lo que un proceso de `multiprocessing` puede
+    retornar su agregado parcial para combinarlo con `merge`.
+
+    Ejemplo:
+    --------
+    >>> agg = Aggregator()
+    >>> as_collection(cedulas, aggregator=agg, keep_results=False)
+    >>> agg.summary("municipio")
+
+    Args:
+        levels (tuple, optional): Jerarquía de ubicación a agrupar. Defaults to ("estado", "municipio", "parroquia", "centro").
+        use_numpy (bool, optional): Acumula en arreglos de NumPy. Tenga en cuenta que debe tener instalado numpy. Defaults to False.
+
+    Raises:
+        ImportError: Si `use_numpy` es True y `numpy` no existe
+    """
+    def __init__(self, levels: tuple = LEVELS, use_numpy: bool = False):
+        self.levels: tuple = tuple(levels)
+        self.errors: int = 0
+        self._index: dict = {}
+        # solo se guarda la bandera y no el modulo numpy, para que el agregado se pueda serializar con pickle
+        self.use_numpy: bool = use_numpy
+        if use_numpy:
+            try:
+                import numpy # type: ignore
+            except ImportError:
+                raise ImportError("El paquete numpy no esta disponible para la clase Aggregator")
+            self._table = numpy.zeros((16, len(_STATUSES)), dtype=numpy.int64)
+        else:
+            self._table: list = []
+
+    @property
+    def _np(self):
+        if not self.use_numpy:
+            return None
+        import numpy # type: ignore
+        return numpy
+
+    def add(self, item: ResponseData|dict) -> None:
+        """Agrega un resultado a los contadores
+
+        Args:
+            item (ResponseData | dict): Resultado del CNE o su versión `dict`
+        """
+        col, rows = self._locate(item)
+        if self._np is None:
+            for r in rows:
+                self._table[r][col] += 1
+        else:
+            self._table[rows, col] += 1
+
+    def add_error(self, count: int = 1) -> None:
+        """Registra cédulas que no pudieron consultarse
+
+        Args:
+            count (int, optional): Cantidad de errores. Defaults to 1.
+        """
+        self.errors += count
+
+    def update(self, data, chunk_size: int = 4096) -> "Aggregator":
+        """Consume un iterable de resultados sin almacenarlos
+
+        Args:
+            data (Iterable[ResponseData | dict]): Resultados a agregar, puede ser un generador
+            chunk_size (int, optional): Resultados acumulados por bloque cuando se usa numpy. Defaults to 4096.
+
+        Returns:
+            Aggregator: La misma instancia para encadenar llamadas
+        """
+        if self._np is None:
+            for item in data:
+                self.add(item)
+            return self
+
+        rows: list = []
+        cols: list = []
+        for item in data:
+            col, r = self._locate(item)
+            rows.extend(r)
+            cols.extend([col] * len(r))
+            if len(rows) >= chunk_size:
+                self._np.add.at(self._table, (rows, cols), 1)
+                rows, cols = [], []
+        if rows:
+            self._np.add.at(self._table, (rows, cols), 1)
+        return self
+
+    def merge(self, other: "Aggregator") -> "Aggregator":
+        """Combina los contadores de otro `Aggregator`, útil para unir lotes procesados en paralelo
+
+        Args:
+            other (Aggregator): Agregado parcial a combinar
+
+        Raises:
+            ValueError: Si los niveles de ubicación no coinciden
+
+        Returns:
+            Aggregator: La misma instancia con los contadores combinados
+        """
+        if other.levels != self.levels:
+            raise ValueError("[PYELECTORAL] No se pueden combinar agregados con distintos niveles")
+        for key, r in other._index.items():
+            row = self._row(key)
+            values = other._table[r]
+            if self._np is None:
+                self._table[row] = [a + int(b) for a, b in zip(self._table[row], values)]
+            else:
+                self._table[row] += self._np.asarray(values, dtype=self._np.int64)
+        self.errors += other.errors
+        return self
+
+    def counts(self, *location: str) -> dict:
+        """Conteos por estatus de una ubicación
+
+        Ejemplo:
+        --------
+        >>> agg.counts()
+            {100: 10, 120: 1, ...}
+        >>> agg.counts("Edo. Miranda", "Mp. Sucre")
+
+        Args:
+            location (str): Ubicación desde el estado hacia abajo, sin argumentos retorna el total general
+
+        Returns:
+            dict: Conteos por código de estatus
+        """
+        r = self._index.get(tuple(location))
+        if r is None:
+            return {s.value: 0 for s in _STATUSES}
+        return {s.value: int(n) for s, n in zip(_STATUSES, self._table[r])}
+
+    @property
+    def total(self) -> int:
+        """Total de resultados agregados"""
+        return sum(self.counts().values())
+
+    @property
+    def deceased(self) -> int:
+        """Total de cédulas de fallecidos"""
+        return self.counts()[STATUS.DECEASED.value]
+
+    @property
+    def disabled(self) -> int:
+        """Total de cédulas inhabilitadas"""
+        return self.counts()[STATUS.DISABLED.value]
+
+    @property
+    def error_rate(self) -> float:
+        """Fracción de cédulas sin respuesta o con error de consulta"""
+        failed = self.errors + self.counts()[STATUS.NO_RESPONSE.value]
+        processed = self.total + self.errors
+        return failed / processed if processed else 0.0
+
+    def summary(self, level: str = None) -> list:
+        """Genera una tabla de conteos agrupada por nivel de ubicación
+
+        Args:
+            level (str, optional): Nivel a agrupar ("estado", "municipio", "parroquia" o "centro"). Defaults to None (total general).
+
+        Raises:
+            ValueError: Si el nivel no es válido
+
+        Returns:
+            list: Lista de `dict` con la ubicación, el total y el conteo por estatus
+        """
+        if level is None:
+            depth = 0
+        elif level in self.levels:
+            depth = self.levels.index(level) + 1
+        else:
+            raise ValueError(f"[PYELECTORAL] Nivel {level} no válido, use {self.levels}")
+
+        table: list = []
+        keys = sorted((k for k in self._index if len(k) == depth), key=lambda k: tuple(v or "" for v in k))
+        for key in keys:
+            row: dict = dict(zip(self.levels, key))
+            counts = self.counts(*key)
+            row["total"] = sum(counts.values())
+            for s in _STATUSES:
+                row[STATUS.get_text(s.value)] = counts[s.value]
+            table.append(row)
+        return table
+
+    def _locate(self, item: ResponseData|dict) -> tuple:
+        if isinstance(item, dict):
+            status = item["status"]
+            location = tuple(item.get(level) for level in self.levels)
+        else:
+            status = item.status
+            location = tuple(getattr(item, level) for level in self.levels)
+        if isinstance(status, STATUS):
+            status = status.value
+        col = _COLUMNS[int(status)]
+        rows = [self._row(location[:depth]) for depth in range(len(self.levels) + 1)]
+        return col, rows
+
+    def _row(self, key: tuple) -> int:
+        r = self._index.get(key)
+        if r is not None:
+            return r
+        r = len(self._index)
+        self._index[key] = r
+        if self._np is None:
+            self._table.append([0] * len(_STATUSES))
+        elif r >= len(self._table):
+            grown = self._np.zeros((len(self._table) * 2, len(_STATUSES)), dtype=self._np.int64)
+            grown[:len(self._table)] = self._table
+            self._table = grown
+        return r
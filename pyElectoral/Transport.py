@@ -0,0 +1,245 @@
+#! /usr/bin/env python3
+#  -*- coding: utf-8 -*-
+"""MODULO TRANSPORT
+
+    Transportes HTTP usados por `pyElectoral.CNE` para realizar las consultas.
+
+    Un transporte es cualquier objeto con el método `get(url, params, timeout, cancel)` que retorne un objeto con
+    `status_code` y `content` (bytes). `timeout` es el tiempo total de la consulta y `cancel` un `threading.Event`
+    que indica que la consulta ya no es necesaria, en ambos casos se debe abandonar la lectura y lanzar
+    `TimeoutError` o `ConnectionAbortedError` respectivamente.
+"""
+import http.client
+import socket
+import threading
+import time
+import requests
+from dataclasses import dataclass
+from urllib.parse import urlsplit, urljoin, quote
+
+
+@dataclass
+class RawResponse:
+    """Respuesta mínima de un transporte"""
+    status_code: int
+    content: bytes
+
+
+def _check(end: float|None, cancel: threading.Event|None) -> float|None:
+    """Verifica el tiempo restante y la cancelación de una consulta en curso"""
+    if cancel is not None and cancel.is_set():
+        raise ConnectionAbortedError("Consulta cancelada")
+    if end is None:
+        return None
+    left = end - time.monotonic()
+    if left <= 0:
+        raise TimeoutError("Tiempo de consulta agotado")
+    return left
+
+
+class RequestsTransport:
+    """Transporte basado en `requests`, usado por defecto"""
+    CHUNK: int = 1024
+
+    def get(self, url: str, params: dict, timeout: float = None, cancel: threading.Event = None) -> RawResponse:
+        """Realiza una petición GET
+
+        El cuerpo se lee por bloques para respetar `timeout` como tiempo total y poder abandonar la consulta con `cancel`.
+
+        Args:
+            url (str): URL a consultar
+            params (dict): Parámetros de la consulta
+            timeout (float, optional): Tiempo total máximo en segundos. Defaults to None.
+            cancel (threading.Event, optional): Evento para abandonar la consulta. Defaults to None.
+
+        Raises:
+            TimeoutError: Si el servidor no responde a tiempo
+            ConnectionAbortedError: Si la consulta fue cancelada
+
+        Returns:
+            RawResponse: Código de estado y contenido en bytes
+        """
+        end = time.monotonic() + timeout if timeout is not None else None
+        try:
+            with requests.get(url, params=params, timeout=timeout, stream=True) as r:
+                chunks: list = []
+                for chunk in r.iter_content(self.CHUNK):
+                    _check(end, cancel)
+                    chunks.append(chunk)
+                return RawResponse(r.status_code, b"".join(chunks))
+        except requests.Timeout as e:
+            raise TimeoutError(str(e))
+
+
+class HTTPTransport:
+    """Transporte HTTP/1.1 mínimo sobre `http.client`
+
+    Mantiene un grupo de conexiones keep-alive por servidor compartido entre hilos, precalcula la ruta
+    de cada URL y retorna los bytes de la respuesta sin decodificar, evitando el costo por consulta de `requests`.
+    Sigue hasta `MAX_REDIRECTS` redirecciones, si son más lanza `ConnectionError`.
+
+    Args:
+        headers (dict, optional): Cabeceras adicionales a enviar. Defaults to None.
+    """
+    _HEADERS: dict = {
+        "User-Agent": "pyElectoral",
+        "Accept": "*/*",
+        "Connection": "keep-alive"
+    }
+    _REDIRECTS: tuple = (301, 302, 303, 307, 308)
+    CHUNK: int = 8192
+    MAX_REDIRECTS: int = 5
+
+    def __init__(self, headers: dict = None):
+        self._headers: dict = {**self._HEADERS, **(headers or {})}
+        self._templates: dict = {}
+        self._lock = threading.Lock()
+        self._idle: dict = {}
+        self._busy: dict = {}
+
+    def get(self, url: str, params: dict, timeout: float = None, cancel: threading.Event = None) -> RawResponse:
+        """Realiza una petición GET reutilizando las conexiones abiertas
+
+        Args:
+            url (str): URL a consultar
+            params (dict): Parámetros de la consulta
+            timeout (float, optional): Tiempo total máximo en segundos. Defaults to None.
+            cancel (threading.Event, optional): Evento para abandonar la consulta. Defaults to None.
+
+        Raises:
+            TimeoutError: Si el servidor no responde a tiempo
+            ConnectionAbortedError: Si la consulta fue cancelada
+            ConnectionError: Si el servidor redirige más de `MAX_REDIRECTS` veces
+
+        Returns:
+            RawResponse: Código de estado y contenido en bytes
+        """
+        end = time.monotonic() + timeout if timeout is not None else None
+        origin, target = self._template(url, tuple(params))
+        path = target % tuple(quote(str(v), safe="") for v in params.values())
+
+        for _ in range(self.MAX_REDIRECTS + 1):
+            status, location, content = self._request(origin, path, end, cancel)
+            if status not in self._REDIRECTS or not location:
+                return RawResponse(status, content)
+            scheme, host, port = origin
+            u = urlsplit(urljoin(f"{scheme}://{host}:{port}{path}", location))
+            origin = (u.scheme, u.hostname, u.port or (443 if u.scheme == "https" else 80))
+            path = (u.path or "/") + (f"?{u.query}" if u.query else "")
+        raise ConnectionError(f"Demasiadas redirecciones desde {url}")
+
+    def close(self, origin: tuple = None) -> None:
+        """Cierra las conexiones abiertas en todos los hilos, las lecturas en curso se interrumpen
+
+        Args:
+            origin (tuple, optional): Servidor (esquema, host, puerto) a cerrar. Defaults to None (todos).
+        """
+        with self._lock:
+            conns: list = []
+            for key in ([origin] if origin else list(self._idle)):
+                conns.extend(self._idle.pop(key, []))
+            for conn, key in list(self._busy.items()):
+                if origin is None or key == origin:
+                    del self._busy[conn]
+                    conns.append(conn)
+        for conn in conns:
+            self._shutdown(conn)
+
+    def _request(self, origin: tuple, path: str, end: float|None, cancel: threading.Event|None) -> tuple:
+        for attempt in (0, 1):
+            conn, reused = self._acquire(origin, _check(end, cancel))
+            try:
+                conn.request("GET", path, headers=self._headers)
+                sock = conn.sock
+                r = conn.getresponse()
+                content = self._read(sock, r, end, cancel)
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                if not self._discard(conn):
+                    raise ConnectionAbortedError("Conexión cerrada por HTTPTransport.close")
+                # el servidor cerró la conexión keep-alive, se reintenta una vez con una nueva
+                if reused and attempt == 0:
+                    continue
+                raise
+            except:
+                self._discard(conn)
+                raise
+            if r.will_close:
+                self._discard(conn)
+            else:
+                self._release(origin, conn)
+            return r.status, r.getheader("Location"), content
+
+    def _read(self, sock: socket.socket, r: http.client.HTTPResponse, end: float|None, cancel: threading.Event|None) -> bytes:
+        chunks: list = []
+        while not r.isclosed():
+            left = _check(end, cancel)
+            if left is not None:
+                sock.settimeout(left)
+            chunk = r.read1(self.CHUNK)
+            chunks.append(chunk)
+            # read1 no cierra la respuesta al completar el Content-Length, sin esto la conexión no se puede reutilizar
+            if not chunk or r.length == 0:
+                r.close()
+        return b"".join(chunks)
+
+    def _template(self, url: str, keys: tuple) -> tuple:
+        t = self._templates.get((url, keys))
+        if t is None:
+            u = urlsplit(url)
+            port = u.port or (443 if u.scheme == "https" else 80)
+            query = "&".join(quote(str(k), safe='').replace("%", "%%") + "=%s" for k in keys)
+            base = (u.path or "/").replace("%", "%%")
+            if u.query:
+                base += "?" + u.query.replace("%", "%%") + "&"
+            else:
+                base += "?"
+            t = ((u.scheme, u.hostname, port), base + query)
+            self._templates[(url, keys)] = t
+        return t
+
+    def _acquire(self, origin: tuple, timeout: float|None) -> tuple:
+        with self._lock:
+            idle: list = self._idle.get(origin)
+            conn = idle.pop() if idle else None
+            reused = conn is not None
+            if conn is None:
+                scheme, host, port = origin
+                cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+                conn = cls(host, port, timeout=timeout)
+            self._busy[conn] = origin
+
+        conn.timeout = timeout
+        if conn.sock is None:
+            try:
+                conn.connect()
+                # las consultas son pequeñas, se evita la espera de Nagle en conexiones reutilizadas
+                conn.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            except:
+                self._discard(conn)
+                raise
+        else:
+            conn.sock.settimeout(timeout)
+        return conn, reused
+
+    def _release(self, origin: tuple, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            if self._busy.pop(conn, None) is not None:
+                self._idle.setdefault(origin, []).append(conn)
+                return
+        # close() la retiró mientras estaba en uso
+        conn.close()
+
+    def _discard(self, conn: http.client.HTTPConnection) -> bool:
+        with self._lock:
+            busy = self._busy.pop(conn, None) is not None
+        conn.close()
+        return busy
+
+    @staticmethod
+    def _shutdown(conn: http.client.HTTPConnection) -> None:
+        if conn.sock is not None:
+            try:
+                conn.sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        conn.close()
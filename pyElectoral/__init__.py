@@ -8,4 +8,6 @@
 """
 from .CNE import *
 from .Data import *
+from .Stats import *
+from .Transport import *
 